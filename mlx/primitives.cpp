@@ -6,7 +6,9 @@
 #include <algorithm>
 #include <cassert>
 #include <cmath>
+#include <limits>
 #include <numeric>
+#include <optional>
 #include <sstream>
 #include <stdexcept>
 
@@ -57,6 +59,44 @@ std::tuple<array, array, int> vmap_binary_op(
   return {a, b, to_ax};
 }
 
+// Returns the value of a constant scalar (possibly broadcast or reshaped) or
+// nothing if the value is not known at trace time.
+std::optional<double> constant_scalar(array a) {
+  while (a.has_primitive() &&
+         (typeid(a.primitive()) == typeid(Broadcast) ||
+          typeid(a.primitive()) == typeid(Reshape) ||
+          typeid(a.primitive()) == typeid(ExpandDims) ||
+          typeid(a.primitive()) == typeid(Squeeze))) {
+    a = a.inputs()[0];
+  }
+  if (a.has_primitive() || !a.is_available() || a.size() != 1) {
+    return std::nullopt;
+  }
+  switch (a.dtype()) {
+    case float32:
+      return a.item<float>();
+    case float16:
+      return static_cast<float>(a.item<float16_t>());
+    case bfloat16:
+      return static_cast<float>(a.item<bfloat16_t>());
+    case int32:
+      return a.item<int32_t>();
+    default:
+      return std::nullopt;
+  }
+}
+
+// Returns the value of a constant integral scalar exponent or nothing if the
+// exponent is not known at trace time.
+std::optional<int> constant_integer_exponent(const array& e) {
+  auto v = constant_scalar(e);
+  if (!v || *v != std::round(*v) ||
+      std::abs(*v) > std::numeric_limits<int>::max()) {
+    return std::nullopt;
+  }
+  return static_cast<int>(*v);
+}
+
 std::tuple<array, array, array, int> vmap_ternary_op(
     const std::vector<array>& inputs,
     const std::vector<int>& axes,
@@ -314,30 +354,35 @@ std::vector<array> AddMM::jvp(
     const std::vector<array>& primals,
     const std::vector<array>& tangents,
     const std::vector<int>& argnums) {
-  std::vector<array> jvp;
+  // Accumulate the matmul terms onto the tangent of c with addmm so each
+  // term is a single fused GEMM
+  std::optional<array> jvp;
+  float beta = 1.0f;
+  if (argnums.back() == 2) {
+    jvp = tangents.back();
+    beta = beta_;
+  }
   for (int i = 0; i < argnums.size(); ++i) {
     auto arg = argnums[i];
-    if (arg == 0) {
-      if (jvp.empty()) {
-        jvp.push_back(matmul(tangents[i], primals[1], stream()));
-      } else {
-        jvp[0] = addmm(jvp[0], tangents[i], primals[1], 1.0f, 1.0f, stream());
-      }
-    } else if (arg == 1) {
-      if (jvp.empty()) {
-        jvp.push_back(matmul(primals[0], tangents[i], stream()));
-      } else {
-        jvp[0] = addmm(jvp[0], primals[0], tangents[i], 1.0f, 1.0f, stream());
-      }
+    if (arg == 2) {
+      break;
+    }
+    auto& a = (arg == 0) ? tangents[i] : primals[0];
+    auto& b = (arg == 0) ? primals[1] : tangents[i];
+    if (jvp) {
+      jvp = addmm(*jvp, a, b, alpha_, beta, stream());
+      beta = 1.0f;
+    } else if (alpha_ == 1.0f) {
+      jvp = matmul(a, b, stream());
     } else {
-      if (jvp.empty()) {
-        jvp.push_back(tangents[i]);
-      } else {
-        jvp[0] = add(jvp[0], tangents[i], stream());
-      }
+      jvp =
+          multiply(array(alpha_, a.dtype()), matmul(a, b, stream()), stream());
     }
   }
-  return jvp;
+  if (beta != 1.0f) {
+    jvp = multiply(array(beta, jvp->dtype()), *jvp, stream());
+  }
+  return {*jvp};
 }
 
 bool AddMM::is_equivalent(const Primitive& other) const {
@@ -2925,10 +2970,18 @@ std::vector<array> Multiply::vjp(
     const std::vector<array>& cotangents,
     const std::vector<int>& argnums,
     const std::vector<array>&) {
+  // A cotangent of ones (e.g. from the gradient of a sum) doesn't need to be
+  // multiplied in
+  bool unit_cotan = constant_scalar(cotangents[0]) == 1.0;
   std::vector<array> vjps;
   for (auto arg : argnums) {
-    vjps.push_back(multiply(
-        conjugate(primals[1 - arg], stream()), cotangents[0], stream()));
+    // For x * x both products are the same so only compute one
+    if (arg == 1 && argnums.size() == 2 && primals[0].id() == primals[1].id()) {
+      vjps.push_back(vjps[0]);
+      continue;
+    }
+    auto vjp = conjugate(primals[1 - arg], stream());
+    vjps.push_back(unit_cotan ? vjp : multiply(vjp, cotangents[0], stream()));
   }
   return vjps;
 }
@@ -3159,7 +3212,21 @@ std::vector<array> Power::vjp(
     const std::vector<array>& outputs) {
   std::vector<array> vjps;
   for (auto arg : argnums) {
-    if (arg == 0) {
+    if (auto n = constant_integer_exponent(primals[1]);
+        arg == 0 && n && *n >= 2) {
+      // n * x^(n - 1) with x^(n - 1) computed by repeated squaring
+      auto x = primals[0];
+      std::optional<array> p;
+      for (int k = *n - 1; k > 0; k >>= 1) {
+        if (k & 1) {
+          p = p ? multiply(*p, x, stream()) : x;
+        }
+        if (k > 1) {
+          x = square(x, stream());
+        }
+      }
+      vjps.push_back(multiply(array(*n, primals[0].dtype()), *p, stream()));
+    } else if (arg == 0) {
       vjps.push_back(multiply(
           power(
               primals[0],
@@ -3817,11 +3884,34 @@ std::vector<array> Scan::vjp(
     //   gradient of the first zero
     // - Everything after the first zero has a gradient of 0
 
-    // Get inclusive and exclusive cum prods
-    auto cprod_exclusive = cumprod(in, axis_, reverse_, !inclusive_, stream());
+    // Get inclusive and exclusive cum prods. The one we don't have is derived
+    // from the output without running a second scan:
+    // - The inclusive cumprod is the exclusive one times the input
+    // - The exclusive cumprod is the inclusive one shifted by one along the
+    //   axis with a one shifted in
     auto cprod_inclusive = outputs[0];
+    auto cprod_exclusive = outputs[0];
     if (!inclusive_) {
-      std::swap(cprod_exclusive, cprod_inclusive);
+      cprod_inclusive = multiply(cprod_exclusive, in, stream());
+    } else if (in.size() > 0) {
+      Shape start(in.ndim(), 0);
+      Shape stop = in.shape();
+      Shape one_shape = in.shape();
+      one_shape[axis_] = 1;
+      auto one = ones(one_shape, in.dtype(), stream());
+      if (reverse_) {
+        start[axis_] = 1;
+        cprod_exclusive = concatenate(
+            {slice(cprod_inclusive, start, stop, stream()), one},
+            axis_,
+            stream());
+      } else {
+        stop[axis_] -= 1;
+        cprod_exclusive = concatenate(
+            {one, slice(cprod_inclusive, start, stop, stream())},
+            axis_,
+            stream());
+      }
     }
 
     // Make the mask for the first zero
@@ -3960,8 +4050,13 @@ std::vector<array> Scatter::vjp(
               gather(cotangents[0], indices, axes_, slice_sizes, stream());
           auto gathered_result =
               gather(result, indices, axes_, slice_sizes, stream());
-          vjps.push_back(
-              multiply(gathered_cotan, gathered_result == updates, stream()));
+          // Select rather than multiply by the mask so that non-finite
+          // cotangents of positions the update lost don't leak into it
+          vjps.push_back(where(
+              equal(gathered_result, updates, stream()),
+              gathered_cotan,
+              array(0, gathered_cotan.dtype()),
+              stream()));
           break;
         }
         default: {
@@ -373,6 +373,12 @@ std::pair<std::vector<array>, std::vector<array>> vjp(
 
   std::vector<array> tape;
 
+  // The indices of the inputs that need a gradient for each array in the
+  // tape, stored flat. The indices of tape[i] are in
+  // tape_argnums[tape_offsets[i]:tape_offsets[i + 1]].
+  std::vector<int> tape_argnums;
+  std::vector<size_t> tape_offsets{0};
+
   std::function<void(array&)> recurse;
   recurse = [&](auto& a) {
     // Check if visited and add to cache if not
@@ -385,26 +391,31 @@ std::pair<std::vector<array>, std::vector<array>> vjp(
       cache.insert(s.id());
     }
 
-    for (auto& input : a.inputs()) {
-      recurse(input);
-    }
-
-    // Stop grad
+    // Stop grad, nothing upstream of it needs to be visited
     if (a.has_primitive()) {
       if (auto& p = a.primitive(); typeid(p) == typeid(StopGradient)) {
         return;
       }
     }
 
-    // Calculate gradient if any inputs require gradient
     for (auto& input : a.inputs()) {
-      if (calc_grad.find(input.id()) != calc_grad.end()) {
-        tape.push_back(a);
-        calc_grad.insert(a.id());
-        for (auto& s : a.siblings()) {
-          calc_grad.insert(s.id());
-        }
-        break;
+      recurse(input);
+    }
+
+    // Calculate gradient if any inputs require gradient. All the inputs have
+    // been visited so whether they need a gradient is already final.
+    auto& inputs = a.inputs();
+    for (int i = 0; i < inputs.size(); ++i) {
+      if (calc_grad.find(inputs[i].id()) != calc_grad.end()) {
+        tape_argnums.push_back(i);
+      }
+    }
+    if (tape_argnums.size() > tape_offsets.back()) {
+      tape.push_back(a);
+      tape_offsets.push_back(tape_argnums.size());
+      calc_grad.insert(a.id());
+      for (auto& s : a.siblings()) {
+        calc_grad.insert(s.id());
       }
     }
   };
@@ -422,16 +433,13 @@ std::pair<std::vector<array>, std::vector<array>> vjp(
                                : default_stream(default_device());
     cotan_map.insert({o.id(), astype(cotans[cotan_idx], o.dtype(), s)});
   }
-  for (auto it = tape.rbegin(); it != tape.rend(); ++it) {
-    auto& a = *it;
+  for (int t = tape.size() - 1; t >= 0; --t) {
+    auto& a = tape[t];
 
     // Get the arguments whose gradients are needed
-    std::vector<int> argnums;
-    for (int i = 0; i < a.inputs().size(); ++i) {
-      if (calc_grad.find(a.inputs()[i].id()) != calc_grad.end()) {
-        argnums.push_back(i);
-      }
-    }
+    std::vector<int> argnums(
+        tape_argnums.begin() + tape_offsets[t],
+        tape_argnums.begin() + tape_offsets[t + 1]);
 
     // Check if any of the array or its siblings have cotangents,
     // if not, we can skip this primitive
@@ -555,17 +563,17 @@ std::pair<std::vector<array>, std::vector<array>> jvp(
       cache.insert(s.id());
     }
 
-    for (auto input : a.inputs()) {
-      recurse(input);
-    }
-
-    // Stop grad
+    // Stop grad, nothing upstream of it needs to be visited
     if (a.has_primitive()) {
       if (auto& p = a.primitive(); typeid(p) == typeid(StopGradient)) {
         return;
       }
     }
 
+    for (auto input : a.inputs()) {
+      recurse(input);
+    }
+
     // Calculate gradient if any inputs require gradient
     for (auto& input : a.inputs()) {
       if (calc_grad.find(input.id()) != calc_grad.end()) {
@@ -174,7 +174,9 @@ nb::object to_scalar(mx::array& a) {
     throw std::invalid_argument(
         "[convert] Only length-1 arrays can be converted to Python scalars.");
   }
-  {
+  // Arrays made from constants are already available so there is no need to
+  // drop and re-acquire the GIL to evaluate them
+  if (!a.is_available()) {
     nb::gil_scoped_release nogil;
     a.eval();
   }
@@ -231,7 +233,7 @@ nb::object tolist(mx::array& a) {
   if (a.ndim() == 0) {
     return to_scalar(a);
   }
-  {
+  if (!a.is_available()) {
     nb::gil_scoped_release nogil;
     a.eval();
   }
@@ -121,24 +121,35 @@ auto py_value_and_grad(
       }
     }
 
+    // Fast path for the common fun(x) with x an array, which doesn't need
+    // the arguments to be flattened and refilled
+    bool single_array = args.size() == 1 && kwargs.size() == 0 &&
+        argnames.empty() && nb::isinstance<mx::array>(args[0]);
+
     // Collect the arrays
     std::vector<mx::array> arrays;
     std::vector<int> counts(1, 0);
     std::vector<int> gradient_indices;
-    for (int i = 0, j = 0; i < args.size(); ++i) {
-      bool needs_grad = (j < argnums.size() && argnums[j] == i);
-      auto argsi = tree_flatten(args[i], /* strict = */ needs_grad);
-      if (needs_grad) {
-        auto old_size = gradient_indices.size();
-        gradient_indices.resize(old_size + argsi.size());
-        std::iota(
-            gradient_indices.begin() + old_size,
-            gradient_indices.end(),
-            arrays.size());
-        j++;
-        counts.push_back(argsi.size());
+    if (single_array) {
+      arrays.push_back(nb::cast<mx::array>(args[0]));
+      gradient_indices.push_back(0);
+      counts.push_back(1);
+    } else {
+      for (int i = 0, j = 0; i < args.size(); ++i) {
+        bool needs_grad = (j < argnums.size() && argnums[j] == i);
+        auto argsi = tree_flatten(args[i], /* strict = */ needs_grad);
+        if (needs_grad) {
+          auto old_size = gradient_indices.size();
+          gradient_indices.resize(old_size + argsi.size());
+          std::iota(
+              gradient_indices.begin() + old_size,
+              gradient_indices.end(),
+              arrays.size());
+          j++;
+          counts.push_back(argsi.size());
+        }
+        arrays.insert(arrays.end(), argsi.begin(), argsi.end());
       }
-      arrays.insert(arrays.end(), argsi.begin(), argsi.end());
     }
     for (auto item : kwargs) {
       bool needs_grad =
@@ -167,26 +178,31 @@ auto py_value_and_grad(
          &kwargs,
          &py_value_out,
          &error_msg_tag,
+         single_array,
          scalar_func_only](const std::vector<mx::array>& a) {
-          nb::list tree;
-          tree.append(args);
-          tree.append(kwargs);
-          tree_fill(tree, a);
-
-          // Call the python function
-          py_value_out = fun(*tree[0], **tree[1]);
-
-          // Replace the tracers with the originals. Don't overwrite
-          // locations which were written to during the call to fun
-          int index = 0;
-          tree_visit_update(tree, [&](nb::handle node) {
-            auto replace_arr = nb::cast<mx::array>(node);
-            if (replace_arr.id() == a[index].id()) {
-              return nb::cast(arrays[index++]);
-            } else {
-              return nb::cast(replace_arr);
-            }
-          });
+          if (single_array) {
+            py_value_out = fun(a[0]);
+          } else {
+            nb::list tree;
+            tree.append(args);
+            tree.append(kwargs);
+            tree_fill(tree, a);
+
+            // Call the python function
+            py_value_out = fun(*tree[0], **tree[1]);
+
+            // Replace the tracers with the originals. Don't overwrite
+            // locations which were written to during the call to fun
+            int index = 0;
+            tree_visit_update(tree, [&](nb::handle node) {
+              auto replace_arr = nb::cast<mx::array>(node);
+              if (replace_arr.id() == a[index].id()) {
+                return nb::cast(arrays[index++]);
+              } else {
+                return nb::cast(replace_arr);
+              }
+            });
+          }
 
           // Validate the return value of the python function
           if (!nb::isinstance<mx::array>(py_value_out)) {
@@ -1359,6 +1375,15 @@ void init_transforms(nb::module_& m) {
       R"pbdoc(
         Returns a function which computes the gradient of ``fun``.
 
+        Every call of the returned function traces ``fun`` and builds the
+        backward graph again. When the gradient is computed repeatedly for
+        inputs with the same shapes and types, wrap it with :func:`compile` so
+        the traced graph is cached and replayed instead:
+
+        .. code-block:: python
+
+            grad_fn = mx.compile(mx.grad(fun))
+
         Args:
             fun (Callable): A function which takes a variable number of
               :class:`array` or trees of :class:`array` and returns
@@ -1498,7 +1523,29 @@ void init_transforms(nb::module_& m) {
   m.def(
       "checkpoint",
       [](nb::callable fun) { return mlx_func(PyCheckpointedFun{fun}, fun); },
-      "fun"_a);
+      "fun"_a,
+      nb::sig("def checkpoint(fun: Callable) -> Callable"),
+      R"pbdoc(
+        Returns a gradient checkpointed version of ``fun``.
+
+        The intermediate values of ``fun`` are not kept around for the backward
+        pass. Instead ``fun`` is evaluated again when its gradient is needed,
+        trading extra computation for lower peak memory.
+
+        Checkpointing composes with the other transformations, so higher order
+        gradients, for instance ``mx.grad(mx.grad(mx.checkpoint(fun)))``,
+        recompute the forward pass of ``fun`` at every level instead of
+        storing it.
+
+        Args:
+            fun (Callable): A function which takes a variable number of
+              :class:`array` or trees of :class:`array` and returns
+              a variable number of :class:`array` or trees of :class:`array`.
+
+        Returns:
+            Callable: A function which has the same input arguments and
+            outputs as ``fun``.
+      )pbdoc");
 
   // Register static Python object cleanup before the interpreter exits
   auto atexit = nb::module_::import_("atexit");
@@ -82,9 +82,35 @@ nb::object tree_map(
 nb::object tree_map(
     nb::object tree,
     std::function<nb::object(nb::handle)> transform) {
-  return tree_map({tree}, [&](std::vector<nb::object> inputs) {
-    return transform(inputs[0]);
-  });
+  // Single tree version of the above. There are no prefix trees to validate
+  // so we walk the tree directly instead of building a vector of subtrees
+  // for every node.
+  std::function<nb::object(nb::handle)> recurse;
+
+  recurse = [&](nb::handle subtree) {
+    if (nb::isinstance<nb::list>(subtree)) {
+      nb::list l;
+      for (auto item : subtree) {
+        l.append(recurse(item));
+      }
+      return nb::cast<nb::object>(l);
+    } else if (nb::isinstance<nb::tuple>(subtree)) {
+      nb::list l;
+      for (auto item : subtree) {
+        l.append(recurse(item));
+      }
+      return nb::cast<nb::object>(nb::tuple(l));
+    } else if (nb::isinstance<nb::dict>(subtree)) {
+      nb::dict d;
+      for (auto item : nb::cast<nb::dict>(subtree)) {
+        d[item.first] = recurse(item.second);
+      }
+      return nb::cast<nb::object>(d);
+    } else {
+      return transform(subtree);
+    }
+  };
+  return recurse(tree);
 }
 
 void tree_visit(
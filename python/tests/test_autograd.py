@@ -103,6 +103,14 @@ class TestAutograd(mlx_tests.MLXTestCase):
         with self.assertRaises(ValueError):
             mx.grad(fun)(mx.ones((2, 2)))
 
+        # Gradients of sums of broadcasted products
+        fun = lambda x, y: (x * y).sum()
+        x = mx.array([[1.0], [2.0]])
+        y = mx.array([[1.0, 2.0, 3.0]])
+        dx, dy = mx.grad(fun, argnums=(0, 1))(x, y)
+        self.assertTrue(mx.array_equal(dx, mx.array([[6.0], [6.0]])))
+        self.assertTrue(mx.array_equal(dy, mx.array([[3.0, 3.0, 3.0]])))
+
     def test_grad_trees(self):
         fun = lambda x, y: x * y
         value, dfdx = mx.value_and_grad(fun, (0, 1))(mx.array(0.5), mx.array(2.0))
@@ -262,6 +270,17 @@ class TestAutograd(mlx_tests.MLXTestCase):
 
         self.assertTrue(mx.allclose(vjps[0], mx.zeros(shape_in)))
 
+        # Arrays behind a stop_gradient still get a gradient when they are
+        # also reachable without one
+        def fun(x):
+            x1 = 2 * x
+            return (mx.stop_gradient(x1) * x1).sum()
+
+        x = mx.array([1.0, 2.0])
+        self.assertTrue(mx.allclose(mx.grad(fun)(x), 4 * x))
+        _, (tangent,) = mx.jvp(fun, (x,), (mx.ones_like(x),))
+        self.assertTrue(mx.allclose(tangent, (4 * x).sum()))
+
     def test_update_state(self):
         y = mx.array([1.0])
         state = mx.zeros((2,))
@@ -342,6 +361,12 @@ class TestAutograd(mlx_tests.MLXTestCase):
         self.assertTrue(mx.allclose(vjps[0], mx.array([[4.0], [5.0], [6.0]])))
         self.assertTrue(mx.allclose(vjps[1], mx.array([[[5.0]]])))
 
+        # Non-finite cotangents don't reach an update that lost
+        cotan = mx.array([4.0, float("inf"), 6.0])
+        _, vjps = mx.vjp(fun, [mx.array([1.0, 2.0, 3.0]), mx.array([[3.0]])], [cotan])
+        self.assertTrue(mx.array_equal(vjps[0], cotan))
+        self.assertTrue(mx.array_equal(vjps[1], mx.array([[0.0]])))
+
     def test_split_against_slice(self):
         def f_split(x):
             a, _, b = x.split(3, -1)
@@ -361,6 +386,19 @@ class TestAutograd(mlx_tests.MLXTestCase):
 
         self.assertTrue(mx.allclose(df1(x), df2(x)))
 
+        # Uneven split points along the leading axis
+        def f_split(x):
+            a, _, b = x.split([10, 60], 0)
+            return (a * b[:10]).sum()
+
+        def f_slice(x):
+            return (x[:10] * x[60:70]).sum()
+
+        df1 = mx.grad(f_split)
+        df2 = mx.grad(f_slice)
+
+        self.assertTrue(mx.allclose(df1(x), df2(x)))
+
     def test_vjp_types(self):
         def fun(x):
             return x
@@ -383,6 +421,18 @@ class TestAutograd(mlx_tests.MLXTestCase):
             out = mx.grad(fun)(mx.array(1.0, t), mx.array(1.0, t))
             self.assertEqual(out.dtype, t)
 
+        # Intermediate cotangents are not upcast either
+        def fun(x, y):
+            return (x * y + x.square()).mean()
+
+        for t in [mx.float16, mx.bfloat16, mx.float32]:
+            x = mx.array([1.0, 2.0, 3.0, 4.0], t)
+            dx, dy = mx.grad(fun, argnums=(0, 1))(x, x)
+            self.assertEqual(dx.dtype, t)
+            self.assertEqual(dy.dtype, t)
+            self.assertTrue(mx.allclose(dx, 3 * x / 4))
+            self.assertTrue(mx.allclose(dy, x / 4))
+
     def test_power_grad(self):
         x = mx.array(0.0)
         g = mx.grad(lambda x: x**2)(x)
@@ -396,6 +446,12 @@ class TestAutograd(mlx_tests.MLXTestCase):
         g = mx.grad(lambda x: x**2)(x)
         self.assertAlmostEqual(g.item(), 4.0)
 
+        # Integer exponents of negative and vector inputs
+        x = mx.array([-2.0, -1.0, 0.0, 0.5, 3.0])
+        for n in [2, 3, 4, 7]:
+            g = mx.grad(lambda x: (x**n).sum())(x)
+            self.assertTrue(mx.allclose(g, n * x ** (n - 1)))
+
     def test_eval_in_grad(self):
         arr = mx.array([1.0])
         cotan = mx.array([1.0, 1.0])
@@ -499,6 +555,20 @@ class TestAutograd(mlx_tests.MLXTestCase):
         expected = mx.array([0.0, 0.0, 0.0, 9.0, 1.0])
         self.assertTrue(mx.allclose(out, expected))
 
+        # Scans over a leading axis match the per-column gradients
+        y = mx.array([[2.0, 2.0], [1.0, 0.0], [2.0, 2.0], [2.0, 0.0], [3.0, 3.0]])
+        for inclusive in [True, False]:
+            for reverse in [True, False]:
+
+                def fun(y):
+                    return mx.cumprod(
+                        y, axis=0, inclusive=inclusive, reverse=reverse
+                    ).sum()
+
+                out = mx.grad(fun)(y)
+                expected = mx.stack([mx.grad(fun)(y[:, i]) for i in range(2)], 1)
+                self.assertTrue(mx.allclose(out, expected))
+
     def test_topk_grad(self):
         a = mx.array([[1, 2, 6, 4, 5], [9, 5, 6, 7, 8]], mx.float32)
 
@@ -509,6 +579,13 @@ class TestAutograd(mlx_tests.MLXTestCase):
         expected = mx.array([[0, 0, 1, 0, 1], [1, 0, 0, 0, 1]], mx.float32)
         self.assertTrue(mx.array_equal(out, expected))
 
+        # Non-uniform cotangents are routed back to the selected elements
+        def fun(x):
+            return 0.5 * mx.topk(x, 2, axis=0).square().sum()
+
+        out = mx.grad(fun)(a.T)
+        self.assertTrue(mx.array_equal(out, expected.T * a.T))
+
     def test_custom_function(self):
         # Make a custom function
         my_exp = mx.custom_function(mx.exp)
@@ -608,6 +685,16 @@ class TestAutograd(mlx_tests.MLXTestCase):
         dfdx = mx.grad(fun)(x)
         self.assertTrue(mx.allclose(dfdx, 2j * mx.ones_like(x)))
 
+        # Non-uniform real cotangents
+        cotan = mx.array([1.0, -2.0, 3.0])
+        _, (dfdx,) = mx.vjp(mx.real, (x,), (cotan,))
+        self.assertEqual(dfdx.dtype, mx.complex64)
+        self.assertTrue(mx.array_equal(dfdx, cotan.astype(mx.complex64)))
+
+        _, (dfdx,) = mx.vjp(mx.imag, (x,), (cotan,))
+        self.assertEqual(dfdx.dtype, mx.complex64)
+        self.assertTrue(mx.array_equal(dfdx, 1j * cotan))
+
     def test_flatten_unflatten_vjps(self):
         def fun(x):
             y = mx.unflatten(x, 0, (2, 2))
@@ -670,6 +757,18 @@ class TestAutograd(mlx_tests.MLXTestCase):
         _, (expected,) = mx.jvp(lambda c: mx.addmm(c, a, b), (c,), (z,))
         self.assertTrue(mx.allclose(tangent, expected))
 
+        # Scaled addmm
+        fun = lambda a, b, c: mx.addmm(c, a, b, alpha=2.0, beta=0.5)
+        _, (tangent,) = mx.jvp(fun, (a, b, c), (x, y, z))
+        expected = 2.0 * (x @ b + a @ y) + 0.5 * z
+        self.assertTrue(mx.allclose(tangent, expected))
+
+        _, (tangent,) = mx.jvp(lambda a: fun(a, b, c), (a,), (x,))
+        self.assertTrue(mx.allclose(tangent, 2.0 * x @ b))
+
+        _, (tangent,) = mx.jvp(lambda c: fun(a, b, c), (c,), (z,))
+        self.assertTrue(mx.allclose(tangent, 0.5 * z))
+
     def test_put_along_axis_grads(self):
         a = mx.zeros((5, 1))
         b = mx.ones((2, 1))
@@ -763,6 +862,35 @@ class TestAutograd(mlx_tests.MLXTestCase):
             mem_post = mx.get_active_memory()
             self.assertEqual(mem_pre, mem_post)
 
+    def test_eager_release_without_cycles(self):
+        # Without a reference cycle the transformed function and the arrays it
+        # captures are released as soon as they go out of scope, there is no
+        # need to wait for the garbage collector
+        for transform in [
+            mx.grad,
+            mx.value_and_grad,
+            mx.custom_function,
+            mx.checkpoint,
+        ]:
+            gc.collect()
+            mx.synchronize()
+            mem_pre = mx.get_active_memory()
+
+            def outer():
+                y = mx.arange(1000, dtype=mx.float32)
+                f = transform(lambda x: (x * y).sum())
+                mx.eval(f(mx.ones(1000)))
+
+            gc.disable()
+            try:
+                for _ in range(5):
+                    outer()
+            finally:
+                gc.enable()
+            mx.synchronize()
+            mem_post = mx.get_active_memory()
+            self.assertEqual(mem_pre, mem_post)
+
     def test_grad_with_copies(self):
         a = mx.array(2.0)
         arrays = [a, a, a]
@@ -76,6 +76,47 @@ class TestCompile(mlx_tests.MLXTestCase):
         self.assertTrue(mx.allclose(c_loss, loss))
         self.assertTrue(mx.allclose(c_val, val))
 
+    def test_compile_grad_no_retrace(self):
+        n_traces = 0
+
+        def fun(x):
+            nonlocal n_traces
+            n_traces += 1
+            return (x * x).sum()
+
+        grad_fn = mx.compile(mx.grad(fun))
+        for _ in range(5):
+            self.assertEqual(grad_fn(mx.array(0.5)).item(), 1.0)
+        self.assertEqual(n_traces, 1)
+
+        # A new shape retraces once
+        self.assertTrue(
+            mx.array_equal(grad_fn(mx.array([0.5, 1.0])), mx.array([1.0, 2.0]))
+        )
+        self.assertEqual(n_traces, 2)
+
+        # Higher order gradients replay the cached graph as well
+        n_traces = 0
+        d2fdx2 = mx.compile(mx.grad(mx.grad(fun)))
+        for _ in range(3):
+            self.assertEqual(d2fdx2(mx.array(0.5)).item(), 2.0)
+        self.assertEqual(n_traces, 1)
+
+    def test_compiled_custom_vjp_is_accepted(self):
+        # A compiled function can be registered as the vjp of a custom function
+        @mx.custom_function
+        def my_exp(x):
+            return mx.exp(x)
+
+        @my_exp.vjp
+        @mx.compile
+        def my_exp_vjp(x, dx, ex):
+            return dx * ex
+
+        x = mx.array([0.5, 1.0])
+        dy = mx.grad(lambda x: my_exp(x).sum())(x)
+        self.assertTrue(mx.allclose(dy, mx.exp(x)))
+
     def test_compile_inputs_with_primitives(self):
         x = mx.array([1, 2, 3])
         y = mx.array([1, 2, 3])
@@ -48,6 +48,22 @@ class TestMemory(mlx_tests.MLXTestCase):
         mx.reset_peak_memory()
         self.assertEqual(mx.get_peak_memory(), 0)
 
+    @unittest.skipIf(not mx.is_available(mx.gpu), "GPU is not available")
+    def test_buffer_reuse(self):
+        # Repeated gradient calls of the same shapes are served from the
+        # buffer cache rather than allocating new buffers
+        x = mx.ones((5, 1))
+        grad_fn = mx.grad(lambda x: (x * x).sum())
+        mx.eval(grad_fn(x))
+        mx.synchronize()
+        cache_mem = mx.get_cache_memory()
+        self.assertTrue(cache_mem > 0)
+
+        for _ in range(5):
+            mx.eval(grad_fn(x))
+        mx.synchronize()
+        self.assertTrue(mx.get_cache_memory() <= cache_mem)
+
     @unittest.skipIf(not mx.metal.is_available(), "Metal is not available")
     def test_wired_memory(self):
         old_limit = mx.set_wired_limit(1000)
@@ -15,6 +15,18 @@
 
 using namespace mlx::core;
 
+// Count the nodes of the given primitive in the graph of an array
+int count_primitives(const array& out, const std::string& name) {
+  std::ostringstream g_ss;
+  print_graph(g_ss, out);
+  std::istringstream lines(g_ss.str());
+  int count = 0;
+  for (std::string line; std::getline(lines, line);) {
+    count += line.rfind(name + " ", 0) == 0;
+  }
+  return count;
+}
+
 TEST_CASE("test stop gradient") {
   auto x = zeros({5, 5});
   auto y = stop_gradient(x);
@@ -214,6 +226,26 @@ TEST_CASE("test vjp") {
     CHECK_EQ(out[1].item<float>(), 1.0f * 2.0f + 3.0f * 3.0f);
     CHECK_EQ(out[2].item<float>(), 3.0f * 2.0f);
   }
+
+  // The vjp of x * x computes the product only once
+  {
+    auto fun = [](array in) { return in * in; };
+    auto out = vjp(fun, array(3.0f), array(2.0f)).second;
+    CHECK_EQ(count_primitives(out, "Multiply"), 1);
+    CHECK_EQ(out.item<float>(), 12.0f);
+  }
+
+  // The unit cotangent of a sum is not multiplied into the product's vjp
+  {
+    auto fun = [](std::vector<array> in) { return sum(in[0] * in[1]); };
+    auto x = array({1.0f, 2.0f, 3.0f});
+    auto y = array({4.0f, 5.0f, 6.0f});
+    auto grads = grad(fun, {0, 1})({x, y});
+    CHECK_EQ(count_primitives(grads[0], "Multiply"), 0);
+    CHECK_EQ(count_primitives(grads[1], "Multiply"), 0);
+    CHECK(array_equal(grads[0], y).item<bool>());
+    CHECK(array_equal(grads[1], x).item<bool>());
+  }
 }
 
 TEST_CASE("test grad") {
@@ -862,6 +894,31 @@ TEST_CASE("test reshape and transpose grads") {
     out = jvp(fn, ones({2, 3, 4}), tangent).second;
     CHECK(array_equal(out, transpose(tangent, {1, 2, 0})).item<bool>());
   }
+
+  // The vjps of reshape like ops share the buffer of the cotangent
+  {
+    auto check_shares_cotan = [](std::function<array(const array&)> fn,
+                                 Shape in_shape,
+                                 Shape out_shape) {
+      auto cotan = full(out_shape, 2.0f);
+      eval(cotan);
+      auto out = vjp(fn, ones(in_shape), cotan).second;
+      eval(out);
+      CHECK_EQ(out.shape(), in_shape);
+      CHECK_EQ(out.data<float>(), cotan.data<float>());
+    };
+
+    check_shares_cotan(
+        [](array a) { return reshape(a, {2, 2, 8}); }, {4, 8}, {2, 2, 8});
+    check_shares_cotan(
+        [](array a) { return flatten(a, 0, 1); }, {2, 2, 8}, {4, 8});
+    check_shares_cotan(
+        [](array a) { return unflatten(a, 0, {2, 2}); }, {4, 8}, {2, 2, 8});
+    check_shares_cotan(
+        [](array a) { return squeeze(a, 1); }, {4, 1, 8}, {4, 8});
+    check_shares_cotan(
+        [](array a) { return expand_dims(a, 1); }, {4, 8}, {4, 1, 8});
+  }
 }
 
 TEST_CASE("test copy grads") {
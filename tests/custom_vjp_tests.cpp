@@ -53,3 +53,18 @@ TEST_CASE("test checkpointing") {
   CHECK_EQ(g[1].item<float>(), 66.0f);
   CHECK_EQ(cnt, 2);
 }
+
+TEST_CASE("test checkpointing higher order gradients") {
+  auto fn = [](const std::vector<array>& inputs) {
+    return std::vector<array>{square(inputs[0]) * inputs[0]};
+  };
+  auto checkpointed_fn = checkpoint(fn);
+  auto f = [&checkpointed_fn](const array& x) {
+    return checkpointed_fn({x})[0];
+  };
+
+  auto x = array(3.0f);
+  CHECK_EQ(grad(f)(x).item<float>(), 27.0f);
+  CHECK_EQ(grad(grad(f))(x).item<float>(), 18.0f);
+  CHECK_EQ(grad(grad(grad(f)))(x).item<float>(), 6.0f);
+}